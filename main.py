@@ -8,8 +8,12 @@ A QtPy-based GUI for editing emulator configuration files.
 
 import sys
 import os
+import copy
+import functools
 import subprocess
 import json
+import re
+import shutil
 from pathlib import Path
 from qtpy.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -18,85 +22,414 @@ from qtpy.QtWidgets import (
     QFileDialog, QMessageBox, QToolBar, QSplitter, QFrame, QDoubleSpinBox,
     QSizePolicy
 )
-from qtpy.QtCore import Qt, QSettings
+from qtpy.QtCore import (
+    Qt, QSettings, QObject, QRunnable, QSignalBlocker, QThreadPool, Signal, Slot,
+    QCoreApplication, QEvent
+)
 from qtpy.QtGui import QAction, QIcon, QPixmap
 
 
+APP_ICON_PATH = os.path.join(os.path.dirname(__file__), 'Appicon.png')
+
+
 # ============================================================================
 # Configuration Parser
 # ============================================================================
 
+# One "key value" entry per line; the value may be empty or contain spaces.
+_LINE_RE = re.compile(r'^[ \t]*(\S+)(?:[ \t]+(.*?))?[ \t\r]*$', re.MULTILINE)
+# Words the parser turns into booleans for any key, including the 'ture'
+# typo found in real prefs files.
+_BOOLS = {'true': True, 'ture': True, 'false': False}
+# Extra spellings accepted only for bool-typed settings (see _cfg_get).
+# '1'/'0' are left out on purpose: numeric settings must stay ints.
+_TRUTHY = frozenset({'true', 'ture', 'yes', 'on'})
+_FALSY = frozenset({'false', 'no', 'off'})
+_NUMERIC_LEAD = frozenset('-+0123456789.')
+
+
 class ConfigParser:
     """Parse and save Basilisk II / Sheepshaver configuration files."""
     
     @staticmethod
     def parse(filepath: str) -> dict:
         """Parse a configuration file into a dictionary."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return {}
+        # Unchanged files (same mtime and size) are served from the cache;
+        # hand out a copy so callers can't mutate the cached entry.
+        return copy.deepcopy(ConfigParser._parse_cached(filepath, st.st_mtime_ns, st.st_size))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_cached(filepath: str, mtime_ns: int, size: int) -> dict:
+        """Parse a configuration file. mtime_ns and size only key the cache."""
         config = {}
         disks = []
         
-        if not os.path.exists(filepath):
-            return config
+        # Slurp the whole file with a single read; the regex does the line splitting
+        data = Path(filepath).read_bytes().decode('utf-8', 'replace')
+        for m in _LINE_RE.finditer(data):
+            key, value = m.group(1), m.group(2) or ''
             
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                parts = line.split(' ', 1)
-                key = parts[0]
-                value = parts[1] if len(parts) > 1 else ''
-                
-                # Handle multiple disk entries
-                if key == 'disk':
-                    disks.append(value)
-                else:
-                    # Convert boolean strings
-                    if value.lower() == 'true':
-                        value = True
-                    elif value.lower() == 'false':
-                        value = False
-                    elif value.isdigit():
+            # Handle multiple disk entries
+            if key == 'disk':
+                disks.append(value)
+                continue
+            
+            # Convert boolean strings, then numbers. Lower-case spellings hit
+            # the table directly; lower() is only paid for other words.
+            try:
+                value = _BOOLS[value]
+            except KeyError:
+                if value[:1] in _NUMERIC_LEAD:
+                    try:
                         value = int(value)
-                    else:
+                    except ValueError:
                         try:
                             value = float(value)
                         except ValueError:
                             pass
-                    config[key] = value
+                else:
+                    value = _BOOLS.get(value.lower(), value)
+            config[key] = value
         
         config['disks'] = disks
         return config
     
     @staticmethod
     def save(filepath: str, config: dict):
-        """Save configuration dictionary to file."""
-        with open(filepath, 'w') as f:
-            # Write disks first
-            for disk in config.get('disks', []):
-                f.write(f"disk {disk}\n")
-            
-            # Write other settings
-            for key, value in config.items():
-                if key == 'disks':
-                    continue
-                if isinstance(value, bool):
-                    value = 'true' if value else 'false'
-                f.write(f"{key} {value}\n")
+        """Save configuration dictionary to file.
+        
+        Entries already in the file are patched in place and keys the editor
+        doesn't manage are kept. A value of None removes the key. The file is
+        only rewritten when its content actually changes.
+        """
+        try:
+            old = Path(filepath).read_bytes()
+        except FileNotFoundError:
+            old = b''
+        
+        # Take the disk list out so the settings loop needs no 'disks' check
+        disks = config.pop('disks', None)
+        try:
+            # Format every setting once up front; None marks a key to remove
+            items = [
+                (key, 'true' if value is True else 'false' if value is False else value)
+                for key, value in config.items()
+            ]
+        finally:
+            if disks is not None:
+                config['disks'] = disks
+        pending = {key: None if value is None else f"{key} {value}\n" for key, value in items}
+        managed = set(pending)
+        disk_lines = [f"disk {disk}\n" for disk in disks or ()]
+        replace_disks = disks is not None
+        disks_written = False
+        
+        parts = []
+        for line in old.decode('utf-8', 'replace').splitlines():
+            m = _LINE_RE.match(line)
+            key = m.group(1) if m else None
+            if key == 'disk' and replace_disks:
+                # The new disk list takes the place of the first disk line
+                if not disks_written:
+                    parts.extend(disk_lines)
+                    disks_written = True
+            elif key in managed:
+                # First occurrence is updated, later duplicates are dropped
+                if key in pending:
+                    entry = pending.pop(key)
+                    if entry is not None:
+                        parts.append(entry)
+            else:
+                parts.append(line + '\n')
+        
+        # Disks go first, new settings at the end
+        if replace_disks and not disks_written:
+            parts[:0] = disk_lines
+        parts.extend(entry for entry in pending.values() if entry is not None)
+        
+        data = ''.join(parts).encode('utf-8')
+        if data != old:
+            ConfigParser._replace_file(filepath, data)
+    
+    @staticmethod
+    def _replace_file(filepath: str, data: bytes):
+        """Atomically replace filepath with data, keeping its mode."""
+        # Replace the file a symlink points at, not the link itself
+        target = os.path.realpath(filepath)
+        tmp = target + '.tmp'
+        try:
+            Path(tmp).write_bytes(data)
+            if os.path.exists(target):
+                shutil.copymode(target, tmp)
+            os.replace(tmp, target)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+class _ParseTask(QRunnable):
+    """Parse one config file and hand the result to the loader's signals."""
+    
+    def __init__(self, loader: 'ConfigLoader', token, filepath: str):
+        super().__init__()
+        self.loader = loader
+        self.token = token
+        self.filepath = filepath
+    
+    def run(self):
+        try:
+            config = ConfigParser.parse(self.filepath)
+        except OSError as e:
+            self.loader.failed.emit(self.token, self.filepath, str(e))
+        else:
+            self.loader.loaded.emit(self.token, config)
+
+
+class ConfigLoader(QObject):
+    """Parses config files on background threads.
+    
+    Results arrive on the GUI thread through loaded(token, config) or
+    failed(token, filepath, error), where token is whatever the caller
+    passed to load().
+    """
+    
+    loaded = Signal(object, object)
+    failed = Signal(object, str, str)
+    
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool()
+    
+    def load(self, token, filepath: str):
+        self.pool.start(_ParseTask(self, token, filepath))
+    
+    def join(self):
+        """Block until all parses have finished, without delivering results."""
+        self.pool.waitForDone()
+    
+    def wait(self):
+        """Block until all parses have finished and deliver their results."""
+        self.join()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.MetaCall)
+
+
+# ============================================================================
+# File Dialogs
+# ============================================================================
+
+# Skip custom folder icon and symlink probes, which stat() every entry and
+# are very slow on network mounts.
+_DIALOG_OPTIONS = (
+    QFileDialog.Option.DontUseCustomDirectoryIcons
+    | QFileDialog.Option.DontResolveSymlinks
+)
+
+
+def open_file_dialog(parent, caption: str, filter_str: str = "All Files (*)") -> str:
+    """Ask for an existing file. Returns '' if cancelled."""
+    path, _ = QFileDialog.getOpenFileName(parent, caption, "", filter_str, options=_DIALOG_OPTIONS)
+    return path
+
+
+def open_dir_dialog(parent, caption: str) -> str:
+    """Ask for an existing directory. Returns '' if cancelled."""
+    return QFileDialog.getExistingDirectory(
+        parent, caption, "", _DIALOG_OPTIONS | QFileDialog.Option.ShowDirsOnly
+    )
+
+
+def path_row(edit: QLineEdit, on_browse) -> QHBoxLayout:
+    """Lay out a path line edit with a "Browse" button calling on_browse."""
+    row = QHBoxLayout()
+    btn = QPushButton("Browse")
+    btn.clicked.connect(on_browse)
+    row.addWidget(edit)
+    row.addWidget(btn)
+    return row
 
 
 # ============================================================================
 # Sub-Tab Widgets
 # ============================================================================
 
-class DrivesTab(QWidget):
-    """Disk and storage configuration."""
+# Combo box choices, shared by the Basilisk II and Sheepshaver tabs
+_SCREEN_MODES = ("win", "dga", "full")
+_COLOR_DEPTHS = ("0 (Default)", "8", "16", "24", "32")
+_RENDERERS = ("software", "opengl", "opengles", "opengles2", "metal")
+_ETHER_MODES = ("slirp", "none", "tap", "sheep_net")
+
+# Basilisk II 'cpu' values and their combo box labels, in combo order
+_CPU_TYPES = ("68020", "68030", "68040")
+_CPU_CODES = (2, 3, 4)
+_CPU_INDEX = {code: i for i, code in enumerate(_CPU_CODES)}
+
+# Type and default of every setting the sub-tabs read, as (type, default)
+_SCHEMA = {
+    'extfs': (str, ''),
+    'rom': (str, ''),
+    'bootdrive': (int, 0),
+    'bootdriver': (int, 0),
+    'nocdrom': (bool, False),
+    'screen': (str, 'win/800/600'),
+    'displaycolordepth': (int, 0),
+    'frameskip': (int, 0),
+    'gfxaccel': (bool, False),
+    'scale_nearest': (bool, False),
+    'scale_integer': (bool, False),
+    'mag_rate': (float, 1.0),
+    'sdlrender': (str, 'software'),
+    'nosound': (bool, False),
+    'sound_buffer': (int, 0),
+    'dsp': (str, '/dev/dsp'),
+    'mixer': (str, '/dev/mixer'),
+    'ether': (str, 'slirp'),
+    'udptunnel': (bool, False),
+    'udpport': (int, 6066),
+    'nonet': (bool, False),
+    'ramsize': (int, 128*1024*1024),
+    'cpu': (int, 3),
+    'modelid': (int, 5),
+    'fpu': (bool, True),
+    'jitfpu': (bool, True),
+    'jitcachesize': (int, 8192),
+    'jitlazyflush': (bool, True),
+    'jitinline': (bool, True),
+    'jitdebug': (bool, False),
+    'cpuclock': (int, 0),
+    'jit68k': (bool, False),
+    'jit': (bool, True),
+    'keyboardtype': (int, 5),
+    'keycodes': (bool, True),
+    'keycodefile': (str, ''),
+    'hotkey': (int, 0),
+    'swap_opt_cmd': (bool, True),
+    'mousewheelmode': (int, 1),
+    'mousewheellines': (int, 3),
+    'init_grab': (bool, False),
+    'hardcursor': (bool, False),
+    'seriala': (str, '/dev/ttyS0'),
+    'serialb': (str, '/dev/ttyS1'),
+    'title': (str, ''),
+    'nogui': (bool, True),
+    'noclipconversion': (bool, False),
+    'ignoresegv': (bool, False),
+    'ignoreillegal': (bool, False),
+    'idlewait': (bool, True),
+    'yearofs': (int, 0),
+    'dayofs': (int, 0),
+    'name_encoding': (int, 3),
+    'delay': (int, 0),
+}
+
+
+def _cfg_get(config: dict, key: str, schema: dict = _SCHEMA):
+    """Fetch key from config as its schema type, or the schema default."""
+    t, default = schema[key]
+    value = config.get(key)
+    if value is None:
+        return default
+    if isinstance(value, t):
+        return value
+    if t is bool and isinstance(value, str):
+        word = value.lower()
+        if word in _TRUTHY:
+            return True
+        if word in _FALSY:
+            return False
+        return default
+    try:
+        return t(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class SubTab(QWidget):
+    """Base for emulator sub-tabs; widgets are built on first show."""
+    
+    # Emitted when the user changes any input, but not while loading
+    modified = Signal()
+    
+    # Read on every load/save. sip wrappers always keep a __dict__, so the
+    # per-widget attributes of the subclasses are left there.
+    __slots__ = ('emulator_type', '_inited', '_pending_config', '_loading')
     
     def __init__(self, emulator_type: str):
         super().__init__()
         self.emulator_type = emulator_type
+        self._inited = False
+        self._pending_config = None
+        self._loading = False
+    
+    def ensure_ui(self):
+        """Build the widgets now and apply any config loaded before that."""
+        if self._inited:
+            return
+        self._inited = True
         self.init_ui()
+        self._watch_inputs()
+        if self._pending_config is not None:
+            config, self._pending_config = self._pending_config, None
+            self.load_config(config)
+    
+    def showEvent(self, event):
+        self.ensure_ui()
+        super().showEvent(event)
+    
+    def load_config(self, config: dict):
+        """Show config in the widgets, or keep it until they are built."""
+        if not self._inited:
+            self._pending_config = config
+            return
+        # Mute valueChanged/toggled/... and repaints while every field is set
+        blockers = [QSignalBlocker(w) for w in self.findChildren(QWidget)]
+        self.setUpdatesEnabled(False)
+        self._loading = True
+        try:
+            self.apply_config(config)
+        finally:
+            self._loading = False
+            self.setUpdatesEnabled(True)
+            for blocker in blockers:
+                blocker.unblock()
+    
+    def apply_config(self, config: dict):
+        """Set the widgets from config. Implemented by each sub-tab."""
+        raise NotImplementedError
+    
+    def _watch_inputs(self):
+        """Route every input widget's change signal to modified."""
+        for w in self.findChildren(QWidget):
+            if isinstance(w, QLineEdit):
+                w.textChanged.connect(self._on_input_changed)
+            elif isinstance(w, QCheckBox):
+                w.toggled.connect(self._on_input_changed)
+            elif isinstance(w, (QSpinBox, QDoubleSpinBox)):
+                w.valueChanged.connect(self._on_input_changed)
+            elif isinstance(w, QComboBox):
+                w.currentTextChanged.connect(self._on_input_changed)
+            elif isinstance(w, QListWidget):
+                # Add/remove/reorder and drag-and-drop all go through the model
+                model = w.model()
+                for signal in (model.rowsInserted, model.rowsRemoved,
+                               model.rowsMoved, model.dataChanged):
+                    signal.connect(self._on_input_changed)
+    
+    def _on_input_changed(self, *args):
+        # List model signals are not muted by load_config's blockers
+        if not self._loading:
+            self.modified.emit()
+
+
+class DrivesTab(SubTab):
+    """Disk and storage configuration."""
     
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -134,22 +467,15 @@ class DrivesTab(QWidget):
         storage_layout = QFormLayout(storage_group)
         
         # ExtFS
-        extfs_layout = QHBoxLayout()
         self.extfs_edit = QLineEdit()
-        extfs_btn = QPushButton("Browse")
-        extfs_btn.clicked.connect(lambda: self.browse_dir(self.extfs_edit))
-        extfs_layout.addWidget(self.extfs_edit)
-        extfs_layout.addWidget(extfs_btn)
-        storage_layout.addRow("ExtFS Path:", extfs_layout)
+        storage_layout.addRow("ExtFS Path:", path_row(
+            self.extfs_edit, functools.partial(self.browse_dir, self.extfs_edit)))
         
         # ROM
-        rom_layout = QHBoxLayout()
         self.rom_edit = QLineEdit()
-        rom_btn = QPushButton("Browse")
-        rom_btn.clicked.connect(lambda: self.browse_file(self.rom_edit, "ROM Files (*.rom);;All Files (*)"))
-        rom_layout.addWidget(self.rom_edit)
-        rom_layout.addWidget(rom_btn)
-        storage_layout.addRow("ROM File:", rom_layout)
+        storage_layout.addRow("ROM File:", path_row(
+            self.rom_edit,
+            functools.partial(self.browse_file, self.rom_edit, "ROM Files (*.rom);;All Files (*)")))
         
         # Boot options
         self.boot_drive = QSpinBox()
@@ -167,9 +493,9 @@ class DrivesTab(QWidget):
         layout.addStretch()
     
     def add_disk(self):
-        path, _ = QFileDialog.getOpenFileName(
+        path = open_file_dialog(
             self, "Select Disk Image",
-            "", "Disk Images (*.img *.dmg *.iso *.hfv);;All Files (*)"
+            "Disk Images (*.img *.dmg *.iso *.hfv);;All Files (*)"
         )
         if path:
             self.disk_list.addItem(path)
@@ -194,27 +520,33 @@ class DrivesTab(QWidget):
             self.disk_list.setCurrentRow(row + 1)
     
     def browse_file(self, line_edit, filter_str):
-        path, _ = QFileDialog.getOpenFileName(self, "Select File", "", filter_str)
+        path = open_file_dialog(self, "Select File", filter_str)
         if path:
             line_edit.setText(path)
     
     def browse_dir(self, line_edit):
-        path = QFileDialog.getExistingDirectory(self, "Select Directory")
+        path = open_dir_dialog(self, "Select Directory")
         if path:
             line_edit.setText(path)
     
-    def load_config(self, config: dict):
-        self.disk_list.clear()
-        for disk in config.get('disks', []):
-            self.disk_list.addItem(disk)
-        self.extfs_edit.setText(str(config.get('extfs', '')))
-        self.rom_edit.setText(str(config.get('rom', '')))
-        self.boot_drive.setValue(config.get('bootdrive', 0))
-        self.boot_driver.setValue(config.get('bootdriver', 0))
-        self.no_cdrom.setChecked(config.get('nocdrom', False))
+    def apply_config(self, config: dict):
+        # Repopulate in one batch without per-item repaints
+        self.disk_list.setUpdatesEnabled(False)
+        try:
+            self.disk_list.clear()
+            self.disk_list.addItems(list(config.get('disks', [])))
+        finally:
+            self.disk_list.setUpdatesEnabled(True)
+        self.extfs_edit.setText(_cfg_get(config, 'extfs'))
+        self.rom_edit.setText(_cfg_get(config, 'rom'))
+        self.boot_drive.setValue(_cfg_get(config, 'bootdrive'))
+        self.boot_driver.setValue(_cfg_get(config, 'bootdriver'))
+        self.no_cdrom.setChecked(_cfg_get(config, 'nocdrom'))
     
     def save_config(self, config: dict):
-        config['disks'] = [self.disk_list.item(i).text() for i in range(self.disk_list.count())]
+        self.ensure_ui()
+        model = self.disk_list.model()
+        config['disks'] = [model.data(model.index(i, 0)) for i in range(model.rowCount())]
         config['extfs'] = self.extfs_edit.text()
         config['rom'] = self.rom_edit.text()
         config['bootdrive'] = self.boot_drive.value()
@@ -222,14 +554,9 @@ class DrivesTab(QWidget):
         config['nocdrom'] = self.no_cdrom.isChecked()
 
 
-class GraphicsTab(QWidget):
+class GraphicsTab(SubTab):
     """Graphics and display configuration."""
     
-    def __init__(self, emulator_type: str):
-        super().__init__()
-        self.emulator_type = emulator_type
-        self.init_ui()
-    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -239,7 +566,7 @@ class GraphicsTab(QWidget):
         
         # Screen mode
         self.screen_mode = QComboBox()
-        self.screen_mode.addItems(["win", "dga", "full"])
+        self.screen_mode.addItems(_SCREEN_MODES)
         display_layout.addRow("Screen Mode:", self.screen_mode)
         
         self.screen_width = QSpinBox()
@@ -253,7 +580,7 @@ class GraphicsTab(QWidget):
         display_layout.addRow("Height:", self.screen_height)
         
         self.color_depth = QComboBox()
-        self.color_depth.addItems(["0 (Default)", "8", "16", "24", "32"])
+        self.color_depth.addItems(_COLOR_DEPTHS)
         display_layout.addRow("Color Depth:", self.color_depth)
         
         layout.addWidget(display_group)
@@ -295,44 +622,37 @@ class GraphicsTab(QWidget):
         render_layout = QFormLayout(render_group)
         
         self.sdl_render = QComboBox()
-        self.sdl_render.addItems(["software", "opengl", "opengles", "opengles2", "metal"])
+        self.sdl_render.addItems(_RENDERERS)
         render_layout.addRow("SDL Render:", self.sdl_render)
         
         layout.addWidget(render_group)
         layout.addStretch()
     
-    def load_config(self, config: dict):
-        screen = str(config.get('screen', 'win/800/600'))
+    def apply_config(self, config: dict):
+        screen = _cfg_get(config, 'screen')
         parts = screen.split('/')
         if len(parts) >= 3:
             self.screen_mode.setCurrentText(parts[0])
             self.screen_width.setValue(int(parts[1]))
             self.screen_height.setValue(int(parts[2]))
         
-        depth = config.get('displaycolordepth', 0)
+        depth = _cfg_get(config, 'displaycolordepth')
         if depth == 0:
             self.color_depth.setCurrentIndex(0)
         else:
             self.color_depth.setCurrentText(str(depth))
         
-        self.frameskip.setValue(config.get('frameskip', 0))
-        self.gfx_accel.setChecked(config.get('gfxaccel', False))
+        self.frameskip.setValue(_cfg_get(config, 'frameskip'))
+        self.gfx_accel.setChecked(_cfg_get(config, 'gfxaccel'))
         
-        # Handle typo in config file ('ture' instead of 'true')
-        scale_nearest = config.get('scale_nearest', False)
-        if isinstance(scale_nearest, str):
-            scale_nearest = scale_nearest.lower() in ['true', 'ture']
-        self.scale_nearest.setChecked(scale_nearest)
+        self.scale_nearest.setChecked(_cfg_get(config, 'scale_nearest'))
+        self.scale_integer.setChecked(_cfg_get(config, 'scale_integer'))
         
-        scale_integer = config.get('scale_integer', False)
-        if isinstance(scale_integer, str):
-            scale_integer = scale_integer.lower() in ['true', 'ture']
-        self.scale_integer.setChecked(scale_integer)
-        
-        self.mag_rate.setValue(float(config.get('mag_rate', 1.0)))
-        self.sdl_render.setCurrentText(config.get('sdlrender', 'software'))
+        self.mag_rate.setValue(_cfg_get(config, 'mag_rate'))
+        self.sdl_render.setCurrentText(_cfg_get(config, 'sdlrender'))
     
     def save_config(self, config: dict):
+        self.ensure_ui()
         config['screen'] = f"{self.screen_mode.currentText()}/{self.screen_width.value()}/{self.screen_height.value()}"
         
         depth_text = self.color_depth.currentText()
@@ -347,14 +667,9 @@ class GraphicsTab(QWidget):
         config['sdlrender'] = self.sdl_render.currentText()
 
 
-class SoundTab(QWidget):
+class SoundTab(SubTab):
     """Sound configuration."""
     
-    def __init__(self, emulator_type: str):
-        super().__init__()
-        self.emulator_type = emulator_type
-        self.init_ui()
-    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -379,27 +694,23 @@ class SoundTab(QWidget):
         layout.addWidget(sound_group)
         layout.addStretch()
     
-    def load_config(self, config: dict):
-        self.no_sound.setChecked(config.get('nosound', False))
-        self.sound_buffer.setValue(config.get('sound_buffer', 0))
-        self.dsp_edit.setText(str(config.get('dsp', '/dev/dsp')))
-        self.mixer_edit.setText(str(config.get('mixer', '/dev/mixer')))
+    def apply_config(self, config: dict):
+        self.no_sound.setChecked(_cfg_get(config, 'nosound'))
+        self.sound_buffer.setValue(_cfg_get(config, 'sound_buffer'))
+        self.dsp_edit.setText(_cfg_get(config, 'dsp'))
+        self.mixer_edit.setText(_cfg_get(config, 'mixer'))
     
     def save_config(self, config: dict):
+        self.ensure_ui()
         config['nosound'] = self.no_sound.isChecked()
         config['sound_buffer'] = self.sound_buffer.value()
         config['dsp'] = self.dsp_edit.text()
         config['mixer'] = self.mixer_edit.text()
 
 
-class NetworkTab(QWidget):
+class NetworkTab(SubTab):
     """Network configuration."""
     
-    def __init__(self, emulator_type: str):
-        super().__init__()
-        self.emulator_type = emulator_type
-        self.init_ui()
-    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -407,7 +718,7 @@ class NetworkTab(QWidget):
         net_layout = QFormLayout(net_group)
         
         self.ether_mode = QComboBox()
-        self.ether_mode.addItems(["slirp", "none", "tap", "sheep_net"])
+        self.ether_mode.addItems(_ETHER_MODES)
         self.ether_mode.setEditable(True)
         net_layout.addRow("Ethernet:", self.ether_mode)
         
@@ -427,15 +738,16 @@ class NetworkTab(QWidget):
         layout.addWidget(net_group)
         layout.addStretch()
     
-    def load_config(self, config: dict):
-        self.ether_mode.setCurrentText(str(config.get('ether', 'slirp')))
+    def apply_config(self, config: dict):
+        self.ether_mode.setCurrentText(_cfg_get(config, 'ether'))
         if self.emulator_type == 'basilisk':
-            self.udp_tunnel.setChecked(config.get('udptunnel', False))
-            self.udp_port.setValue(config.get('udpport', 6066))
+            self.udp_tunnel.setChecked(_cfg_get(config, 'udptunnel'))
+            self.udp_port.setValue(_cfg_get(config, 'udpport'))
         if self.emulator_type == 'sheepshaver':
-            self.no_net.setChecked(config.get('nonet', False))
+            self.no_net.setChecked(_cfg_get(config, 'nonet'))
     
     def save_config(self, config: dict):
+        self.ensure_ui()
         config['ether'] = self.ether_mode.currentText()
         if self.emulator_type == 'basilisk':
             config['udptunnel'] = self.udp_tunnel.isChecked()
@@ -444,14 +756,9 @@ class NetworkTab(QWidget):
             config['nonet'] = self.no_net.isChecked()
 
 
-class CpuMemoryTab(QWidget):
+class CpuMemoryTab(SubTab):
     """CPU and Memory configuration."""
     
-    def __init__(self, emulator_type: str):
-        super().__init__()
-        self.emulator_type = emulator_type
-        self.init_ui()
-    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -472,6 +779,7 @@ class CpuMemoryTab(QWidget):
         ]
         for name, size in ram_sizes:
             self.ram_size.addItem(name, size)
+        self._ram_index = {size: i for i, (_, size) in enumerate(ram_sizes)}
         mem_layout.addRow("RAM Size:", self.ram_size)
         
         layout.addWidget(mem_group)
@@ -482,7 +790,7 @@ class CpuMemoryTab(QWidget):
             cpu_layout = QFormLayout(cpu_group)
             
             self.cpu_type = QComboBox()
-            self.cpu_type.addItems(["68020", "68030", "68040"])
+            self.cpu_type.addItems(_CPU_TYPES)
             cpu_layout.addRow("CPU Type:", self.cpu_type)
             
             self.model_id = QSpinBox()
@@ -537,37 +845,34 @@ class CpuMemoryTab(QWidget):
         layout.addWidget(jit_group)
         layout.addStretch()
     
-    def load_config(self, config: dict):
-        ram = config.get('ramsize', 128*1024*1024)
-        for i in range(self.ram_size.count()):
-            if self.ram_size.itemData(i) == ram:
-                self.ram_size.setCurrentIndex(i)
-                break
+    def apply_config(self, config: dict):
+        ram = _cfg_get(config, 'ramsize')
+        idx = self._ram_index.get(ram)
+        if idx is not None:
+            self.ram_size.setCurrentIndex(idx)
         
         if self.emulator_type == 'basilisk':
-            cpu = config.get('cpu', 3)
-            cpu_map = {2: 0, 3: 1, 4: 2}
-            self.cpu_type.setCurrentIndex(cpu_map.get(cpu, 1))
-            self.model_id.setValue(config.get('modelid', 5))
-            self.fpu_enabled.setChecked(config.get('fpu', True))
-            self.jit_fpu.setChecked(config.get('jitfpu', True))
-            self.jit_cache_size.setValue(config.get('jitcachesize', 8192))
-            self.jit_lazy_flush.setChecked(config.get('jitlazyflush', True))
-            self.jit_inline.setChecked(config.get('jitinline', True))
-            self.jit_debug.setChecked(config.get('jitdebug', False))
+            self.cpu_type.setCurrentIndex(_CPU_INDEX.get(_cfg_get(config, 'cpu'), 1))
+            self.model_id.setValue(_cfg_get(config, 'modelid'))
+            self.fpu_enabled.setChecked(_cfg_get(config, 'fpu'))
+            self.jit_fpu.setChecked(_cfg_get(config, 'jitfpu'))
+            self.jit_cache_size.setValue(_cfg_get(config, 'jitcachesize'))
+            self.jit_lazy_flush.setChecked(_cfg_get(config, 'jitlazyflush'))
+            self.jit_inline.setChecked(_cfg_get(config, 'jitinline'))
+            self.jit_debug.setChecked(_cfg_get(config, 'jitdebug'))
         
         if self.emulator_type == 'sheepshaver':
-            self.cpu_clock.setValue(config.get('cpuclock', 0))
-            self.jit_68k.setChecked(config.get('jit68k', False))
+            self.cpu_clock.setValue(_cfg_get(config, 'cpuclock'))
+            self.jit_68k.setChecked(_cfg_get(config, 'jit68k'))
         
-        self.jit_enabled.setChecked(config.get('jit', True))
+        self.jit_enabled.setChecked(_cfg_get(config, 'jit'))
     
     def save_config(self, config: dict):
+        self.ensure_ui()
         config['ramsize'] = self.ram_size.currentData()
         
         if self.emulator_type == 'basilisk':
-            cpu_map = {0: 2, 1: 3, 2: 4}
-            config['cpu'] = cpu_map.get(self.cpu_type.currentIndex(), 3)
+            config['cpu'] = _CPU_CODES[self.cpu_type.currentIndex()]
             config['modelid'] = self.model_id.value()
             config['fpu'] = self.fpu_enabled.isChecked()
             config['jitfpu'] = self.jit_fpu.isChecked()
@@ -583,14 +888,9 @@ class CpuMemoryTab(QWidget):
         config['jit'] = self.jit_enabled.isChecked()
 
 
-class InputTab(QWidget):
+class InputTab(SubTab):
     """Keyboard and mouse configuration."""
     
-    def __init__(self, emulator_type: str):
-        super().__init__()
-        self.emulator_type = emulator_type
-        self.init_ui()
-    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -605,13 +905,8 @@ class InputTab(QWidget):
         self.keycodes = QCheckBox("Use Keycodes")
         kb_layout.addRow("", self.keycodes)
         
-        keycode_layout = QHBoxLayout()
         self.keycode_file = QLineEdit()
-        keycode_btn = QPushButton("Browse")
-        keycode_btn.clicked.connect(self.browse_keycode_file)
-        keycode_layout.addWidget(self.keycode_file)
-        keycode_layout.addWidget(keycode_btn)
-        kb_layout.addRow("Keycode File:", keycode_layout)
+        kb_layout.addRow("Keycode File:", path_row(self.keycode_file, self.browse_keycode_file))
         
         self.hotkey = QSpinBox()
         self.hotkey.setRange(0, 255)
@@ -645,23 +940,24 @@ class InputTab(QWidget):
         layout.addStretch()
     
     def browse_keycode_file(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Keycode File", "", "All Files (*)")
+        path = open_file_dialog(self, "Select Keycode File")
         if path:
             self.keycode_file.setText(path)
     
-    def load_config(self, config: dict):
-        self.kb_type.setValue(config.get('keyboardtype', 5))
-        self.keycodes.setChecked(config.get('keycodes', True))
-        self.keycode_file.setText(str(config.get('keycodefile', '')))
-        self.hotkey.setValue(config.get('hotkey', 0))
-        self.swap_opt_cmd.setChecked(config.get('swap_opt_cmd', True))
-        self.mouse_wheel_mode.setValue(config.get('mousewheelmode', 1))
-        self.mouse_wheel_lines.setValue(config.get('mousewheellines', 3))
-        self.init_grab.setChecked(config.get('init_grab', False))
+    def apply_config(self, config: dict):
+        self.kb_type.setValue(_cfg_get(config, 'keyboardtype'))
+        self.keycodes.setChecked(_cfg_get(config, 'keycodes'))
+        self.keycode_file.setText(_cfg_get(config, 'keycodefile'))
+        self.hotkey.setValue(_cfg_get(config, 'hotkey'))
+        self.swap_opt_cmd.setChecked(_cfg_get(config, 'swap_opt_cmd'))
+        self.mouse_wheel_mode.setValue(_cfg_get(config, 'mousewheelmode'))
+        self.mouse_wheel_lines.setValue(_cfg_get(config, 'mousewheellines'))
+        self.init_grab.setChecked(_cfg_get(config, 'init_grab'))
         if self.emulator_type == 'sheepshaver':
-            self.hard_cursor.setChecked(config.get('hardcursor', False))
+            self.hard_cursor.setChecked(_cfg_get(config, 'hardcursor'))
     
     def save_config(self, config: dict):
+        self.ensure_ui()
         config['keyboardtype'] = self.kb_type.value()
         config['keycodes'] = self.keycodes.isChecked()
         config['keycodefile'] = self.keycode_file.text()
@@ -674,14 +970,9 @@ class InputTab(QWidget):
             config['hardcursor'] = self.hard_cursor.isChecked()
 
 
-class SerialTab(QWidget):
+class SerialTab(SubTab):
     """Serial port configuration."""
     
-    def __init__(self, emulator_type: str):
-        super().__init__()
-        self.emulator_type = emulator_type
-        self.init_ui()
-    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -699,23 +990,19 @@ class SerialTab(QWidget):
         layout.addWidget(serial_group)
         layout.addStretch()
     
-    def load_config(self, config: dict):
-        self.serial_a.setText(str(config.get('seriala', '/dev/ttyS0')))
-        self.serial_b.setText(str(config.get('serialb', '/dev/ttyS1')))
+    def apply_config(self, config: dict):
+        self.serial_a.setText(_cfg_get(config, 'seriala'))
+        self.serial_b.setText(_cfg_get(config, 'serialb'))
     
     def save_config(self, config: dict):
+        self.ensure_ui()
         config['seriala'] = self.serial_a.text()
         config['serialb'] = self.serial_b.text()
 
 
-class MiscTab(QWidget):
+class MiscTab(SubTab):
     """Miscellaneous configuration."""
     
-    def __init__(self, emulator_type: str):
-        super().__init__()
-        self.emulator_type = emulator_type
-        self.init_ui()
-    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -787,24 +1074,24 @@ class MiscTab(QWidget):
         
         layout.addStretch()
     
-    def load_config(self, config: dict):
-        self.title_edit.setText(str(config.get('title', '')))
-        self.no_gui.setChecked(config.get('nogui', True))
-        self.no_clip_conversion.setChecked(config.get('noclipconversion', False))
-        self.ignore_segv.setChecked(config.get('ignoresegv', False))
+    def apply_config(self, config: dict):
+        self.title_edit.setText(_cfg_get(config, 'title'))
+        self.no_gui.setChecked(_cfg_get(config, 'nogui'))
+        self.no_clip_conversion.setChecked(_cfg_get(config, 'noclipconversion'))
+        self.ignore_segv.setChecked(_cfg_get(config, 'ignoresegv'))
         if self.emulator_type == 'sheepshaver':
-            self.ignore_illegal.setChecked(config.get('ignoreillegal', False))
-        self.idle_wait.setChecked(config.get('idlewait', True))
-        self.year_offset.setValue(config.get('yearofs', 0))
-        self.day_offset.setValue(config.get('dayofs', 0))
-        self.name_encoding.setValue(config.get('name_encoding', 3))
+            self.ignore_illegal.setChecked(_cfg_get(config, 'ignoreillegal'))
+        self.idle_wait.setChecked(_cfg_get(config, 'idlewait'))
+        self.year_offset.setValue(_cfg_get(config, 'yearofs'))
+        self.day_offset.setValue(_cfg_get(config, 'dayofs'))
+        self.name_encoding.setValue(_cfg_get(config, 'name_encoding'))
         if self.emulator_type == 'basilisk':
-            self.delay.setValue(config.get('delay', 0))
+            self.delay.setValue(_cfg_get(config, 'delay'))
     
     def save_config(self, config: dict):
-        title = self.title_edit.text().strip()
-        if title:
-            config['title'] = title
+        self.ensure_ui()
+        # An empty title removes the entry from the file
+        config['title'] = self.title_edit.text().strip() or None
         config['nogui'] = self.no_gui.isChecked()
         config['noclipconversion'] = self.no_clip_conversion.isChecked()
         config['ignoresegv'] = self.ignore_segv.isChecked()
@@ -829,6 +1116,9 @@ class EmulatorTab(QWidget):
         super().__init__()
         self.emulator_type = emulator_type
         self.config = {}
+        # File self.config was loaded from (or last saved to)
+        self.config_path = ''
+        self._dirty = set()
         self.init_ui()
     
     def init_ui(self):
@@ -836,6 +1126,8 @@ class EmulatorTab(QWidget):
         
         self.sub_tabs = QTabWidget()
         
+        # Constructing a sub-tab is cheap: its widgets are only built when
+        # it is first shown (or saved), so nothing is deferred here.
         self.drives_tab = DrivesTab(self.emulator_type)
         self.graphics_tab = GraphicsTab(self.emulator_type)
         self.sound_tab = SoundTab(self.emulator_type)
@@ -845,41 +1137,108 @@ class EmulatorTab(QWidget):
         self.serial_tab = SerialTab(self.emulator_type)
         self.misc_tab = MiscTab(self.emulator_type)
         
-        self.sub_tabs.addTab(self.drives_tab, "💾 Drives")
-        self.sub_tabs.addTab(self.graphics_tab, "🖥️ Graphics")
-        self.sub_tabs.addTab(self.sound_tab, "🔊 Sound")
-        self.sub_tabs.addTab(self.network_tab, "🌐 Network")
-        self.sub_tabs.addTab(self.cpu_memory_tab, "⚡ CPU/Memory")
-        self.sub_tabs.addTab(self.input_tab, "⌨️ Input")
-        self.sub_tabs.addTab(self.serial_tab, "📡 Serial")
-        self.sub_tabs.addTab(self.misc_tab, "⚙️ Misc")
+        self.tabs = (
+            self.drives_tab, self.graphics_tab, self.sound_tab, self.network_tab,
+            self.cpu_memory_tab, self.input_tab, self.serial_tab, self.misc_tab,
+        )
+        labels = (
+            "💾 Drives", "🖥️ Graphics", "🔊 Sound", "🌐 Network",
+            "⚡ CPU/Memory", "⌨️ Input", "📡 Serial", "⚙️ Misc",
+        )
+        for tab, label in zip(self.tabs, labels):
+            self.sub_tabs.addTab(tab, label)
+            tab.modified.connect(functools.partial(self._dirty.add, tab))
         
         layout.addWidget(self.sub_tabs)
     
-    def load_config(self, config: dict):
+    def load_config(self, config: dict, filepath: str = ''):
         self.config = config
-        self.drives_tab.load_config(config)
-        self.graphics_tab.load_config(config)
-        self.sound_tab.load_config(config)
-        self.network_tab.load_config(config)
-        self.cpu_memory_tab.load_config(config)
-        self.input_tab.load_config(config)
-        self.serial_tab.load_config(config)
-        self.misc_tab.load_config(config)
-    
-    def save_config(self) -> dict:
+        self.config_path = filepath
+        self._dirty.clear()
+        # Hidden sub-tabs keep the config and apply it when first shown
+        for tab in self.tabs:
+            tab.load_config(config)
+    
+    def save_config(self, filepath: str = '') -> dict:
+        """Collect the settings to write to filepath with ConfigParser.save.
+        
+        When filepath is the file the config was loaded from, only the
+        sub-tabs the user touched report all their keys, and the others only
+        add settings the file lacks so the defaults they show get written.
+        ConfigParser.save patches those in place and leaves every other line
+        of the file as it is. For any other target, or when the file is gone,
+        every sub-tab reports its values (building its widgets first if it
+        was never shown).
+        """
         config = {}
-        self.drives_tab.save_config(config)
-        self.graphics_tab.save_config(config)
-        self.sound_tab.save_config(config)
-        self.network_tab.save_config(config)
-        self.cpu_memory_tab.save_config(config)
-        self.input_tab.save_config(config)
-        self.serial_tab.save_config(config)
-        self.misc_tab.save_config(config)
+        if self.config and filepath == self.config_path and os.path.exists(filepath):
+            for tab in self.tabs:
+                if tab in self._dirty:
+                    tab.save_config(config)
+                else:
+                    values = {}
+                    tab.save_config(values)
+                    config.update((key, value) for key, value in values.items()
+                                  if key not in self.config)
+        else:
+            for tab in self.tabs:
+                tab.save_config(config)
+        # Keep self.config in step with the file; None removes a key
+        merged = {**self.config, **config}
+        self.config = {key: value for key, value in merged.items() if value is not None}
+        self.config_path = filepath
+        self._dirty.clear()
         return config
 
 
+# ============================================================================
+# Application Settings
+# ============================================================================
+
+class CachedSettings:
+    """QSettings wrapper that keeps every value it has seen in memory.
+    
+    The backend (INI file or registry) is only read the first time a key
+    is asked for, and only written when a value actually changes.
+    """
+    
+    def __init__(self, organization: str, application: str):
+        self._qs = QSettings(organization, application)
+        self._cache = {}
+        self._groups = []
+    
+    def _full_key(self, key: str) -> str:
+        return '/'.join((*self._groups, key))
+    
+    def beginGroup(self, prefix: str):
+        self._qs.beginGroup(prefix)
+        self._groups.append(prefix)
+    
+    def endGroup(self):
+        self._qs.endGroup()
+        self._groups.pop()
+    
+    def value(self, key: str, default=None):
+        full_key = self._full_key(key)
+        try:
+            value = self._cache[full_key]
+        except KeyError:
+            # Cache the raw lookup (None if unset), not the caller's default
+            value = self._cache[full_key] = self._qs.value(key)
+        return default if value is None else value
+    
+    def setValue(self, key: str, value):
+        full_key = self._full_key(key)
+        if full_key in self._cache and self._cache[full_key] == value:
+            return
+        self._qs.setValue(key, value)
+        self._cache[full_key] = value
+    
+    def sync(self):
+        """Flush pending writes to the backend now."""
+        self._qs.sync()
+
+
 # ============================================================================
 # Settings Tab
 # ============================================================================
@@ -887,66 +1246,32 @@ class EmulatorTab(QWidget):
 class SettingsTab(QWidget):
     """Application settings - executable and config paths."""
     
-    def __init__(self):
+    def __init__(self, settings: CachedSettings):
         super().__init__()
-        self.settings = QSettings('DINKIssTyle', 'EmulatorPrefs')
+        self.settings = settings
         self.init_ui()
         self.load_settings()
     
     def init_ui(self):
         layout = QVBoxLayout(self)
         
-        # Basilisk II Settings
-        basilisk_group = QGroupBox("Basilisk II")
-        basilisk_layout = QFormLayout(basilisk_group)
-        
-        basilisk_exe_layout = QHBoxLayout()
-        self.basilisk_exe = QLineEdit()
-        basilisk_exe_btn = QPushButton("Browse")
-        basilisk_exe_btn.clicked.connect(lambda: self.browse_exe(self.basilisk_exe))
-        basilisk_exe_layout.addWidget(self.basilisk_exe)
-        basilisk_exe_layout.addWidget(basilisk_exe_btn)
-        basilisk_layout.addRow("Executable:", basilisk_exe_layout)
-        
-        basilisk_cfg_layout = QHBoxLayout()
-        self.basilisk_cfg = QLineEdit()
-        basilisk_cfg_btn = QPushButton("Browse")
-        basilisk_cfg_btn.clicked.connect(lambda: self.browse_file(self.basilisk_cfg))
-        basilisk_cfg_layout.addWidget(self.basilisk_cfg)
-        basilisk_cfg_layout.addWidget(basilisk_cfg_btn)
-        basilisk_layout.addRow("Config File:", basilisk_cfg_layout)
-        
-        zap_basilisk_btn = QPushButton("Zap PRAM")
-        zap_basilisk_btn.clicked.connect(lambda: self.zap_pram('basilisk'))
-        basilisk_layout.addRow("", zap_basilisk_btn)
-        
-        layout.addWidget(basilisk_group)
-        
-        # Sheepshaver Settings
-        sheepshaver_group = QGroupBox("Sheepshaver")
-        sheepshaver_layout = QFormLayout(sheepshaver_group)
-        
-        sheepshaver_exe_layout = QHBoxLayout()
-        self.sheepshaver_exe = QLineEdit()
-        sheepshaver_exe_btn = QPushButton("Browse")
-        sheepshaver_exe_btn.clicked.connect(lambda: self.browse_exe(self.sheepshaver_exe))
-        sheepshaver_exe_layout.addWidget(self.sheepshaver_exe)
-        sheepshaver_exe_layout.addWidget(sheepshaver_exe_btn)
-        sheepshaver_layout.addRow("Executable:", sheepshaver_exe_layout)
-        
-        sheepshaver_cfg_layout = QHBoxLayout()
-        self.sheepshaver_cfg = QLineEdit()
-        sheepshaver_cfg_btn = QPushButton("Browse")
-        sheepshaver_cfg_btn.clicked.connect(lambda: self.browse_file(self.sheepshaver_cfg))
-        sheepshaver_cfg_layout.addWidget(self.sheepshaver_cfg)
-        sheepshaver_cfg_layout.addWidget(sheepshaver_cfg_btn)
-        sheepshaver_layout.addRow("Config File:", sheepshaver_cfg_layout)
-        
-        zap_sheepshaver_btn = QPushButton("Zap PRAM")
-        zap_sheepshaver_btn.clicked.connect(lambda: self.zap_pram('sheepshaver'))
-        sheepshaver_layout.addRow("", zap_sheepshaver_btn)
-        
-        layout.addWidget(sheepshaver_group)
+        # Line edits keyed by their settings key, e.g. 'basilisk/exe'
+        self.fields = {}
+        for emulator_type, title in (('basilisk', "Basilisk II"), ('sheepshaver', "Sheepshaver")):
+            group = QGroupBox(title)
+            form = QFormLayout(group)
+            
+            for kind, label, browse in (('exe', "Executable:", self.browse_exe),
+                                        ('cfg', "Config File:", self.browse_file)):
+                edit = QLineEdit()
+                form.addRow(label, path_row(edit, functools.partial(browse, edit)))
+                self.fields[f'{emulator_type}/{kind}'] = edit
+            
+            zap_btn = QPushButton("Zap PRAM")
+            zap_btn.clicked.connect(functools.partial(self.zap_pram, emulator_type))
+            form.addRow("", zap_btn)
+            
+            layout.addWidget(group)
         
         # Save button
         save_btn = QPushButton("Save Settings")
@@ -956,35 +1281,36 @@ class SettingsTab(QWidget):
         layout.addStretch()
     
     def browse_exe(self, line_edit):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Executable", "", "All Files (*)")
+        path = open_file_dialog(self, "Select Executable")
         if path:
             line_edit.setText(path)
     
     def browse_file(self, line_edit):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Config File", "", "All Files (*)")
+        path = open_file_dialog(self, "Select Config File")
         if path:
             line_edit.setText(path)
     
     def load_settings(self):
-        self.basilisk_exe.setText(self.settings.value('basilisk/exe', ''))
-        self.basilisk_cfg.setText(self.settings.value('basilisk/cfg', ''))
-        self.sheepshaver_exe.setText(self.settings.value('sheepshaver/exe', ''))
-        self.sheepshaver_cfg.setText(self.settings.value('sheepshaver/cfg', ''))
+        for key, edit in self.fields.items():
+            edit.setText(self.settings.value(key, ''))
     
     def save_settings(self):
-        self.settings.setValue('basilisk/exe', self.basilisk_exe.text())
-        self.settings.setValue('basilisk/cfg', self.basilisk_cfg.text())
-        self.settings.setValue('sheepshaver/exe', self.sheepshaver_exe.text())
-        self.settings.setValue('sheepshaver/cfg', self.sheepshaver_cfg.text())
+        # Write each emulator's keys as a group and flush once at the end;
+        # unchanged values are skipped by CachedSettings.
+        for emulator_type in ('basilisk', 'sheepshaver'):
+            self.settings.beginGroup(emulator_type)
+            for kind in ('exe', 'cfg'):
+                self.settings.setValue(kind, self.fields[f'{emulator_type}/{kind}'].text())
+            self.settings.endGroup()
+        self.settings.sync()
         QMessageBox.information(self, "Settings", "Settings saved successfully!")
     
     def zap_pram(self, emulator_type: str):
         """Delete PRAM/NVRAM file for the specified emulator."""
+        cfg_path = self.fields[f'{emulator_type}/cfg'].text()
         if emulator_type == 'basilisk':
-            cfg_path = self.basilisk_cfg.text()
             pram_filename = '.basilisk_ii_xpram'
         else:
-            cfg_path = self.sheepshaver_cfg.text()
             pram_filename = '.sheepshaver_nvram'
         
         if not cfg_path:
@@ -1005,6 +1331,41 @@ class SettingsTab(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to delete PRAM file:\n{e}")
 
 
+# ============================================================================
+# Emulator Launching
+# ============================================================================
+
+# Children started via posix_spawn, reaped on later launches
+_spawned_pids = []
+
+
+def _spawn_detached(args: list) -> int:
+    """Start args[0] (looked up on PATH) in a new session and return its pid.
+    
+    posix_spawn avoids forking the whole GUI process. Platforms without
+    it, or without POSIX_SPAWN_SETSID, fall back to subprocess.Popen.
+    """
+    # Collect emulators that have exited since the last launch, so they
+    # don't linger as zombies (subprocess does the same for Popen objects)
+    for pid in _spawned_pids[:]:
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            _spawned_pids.remove(pid)
+    
+    if hasattr(os, 'posix_spawnp'):
+        try:
+            pid = os.posix_spawnp(args[0], args, os.environ, setsid=True)
+        except NotImplementedError:
+            pass
+        else:
+            _spawned_pids.append(pid)
+            return pid
+    return subprocess.Popen(args, start_new_session=True).pid
+
+
 # ============================================================================
 # Main Window
 # ============================================================================
@@ -1012,9 +1373,16 @@ class SettingsTab(QWidget):
 class PrefsEditor(QMainWindow):
     """Main application window."""
     
+    # Scaled About dialog icon; a null QPixmap once loading has failed
+    _about_pixmap = None
+    
     def __init__(self):
         super().__init__()
-        self.settings = QSettings('DINKIssTyle', 'EmulatorPrefs')
+        self.settings = CachedSettings('DINKIssTyle', 'EmulatorPrefs')
+        self.loader = ConfigLoader()
+        self.loader.loaded.connect(self.on_config_loaded)
+        self.loader.failed.connect(self.on_load_failed)
+        self._load_generation = 0
         self.init_ui()
         self.load_configs()
     
@@ -1024,6 +1392,10 @@ class PrefsEditor(QMainWindow):
         
         # Toolbar
         toolbar = QToolBar("Main Toolbar")
+        # Fixed toolbar without a drag handle, laid out once after it is filled
+        toolbar.setMovable(False)
+        toolbar.setFloatable(False)
+        toolbar.setUpdatesEnabled(False)
         self.addToolBar(toolbar)
         
         save_action = QAction("💾 Save All", self)
@@ -1039,11 +1411,11 @@ class PrefsEditor(QMainWindow):
         toolbar.addSeparator()
         
         launch_basilisk = QAction("▶️ Launch Basilisk", self)
-        launch_basilisk.triggered.connect(lambda: self.launch_emulator('basilisk'))
+        launch_basilisk.triggered.connect(self._launch_basilisk)
         toolbar.addAction(launch_basilisk)
         
         launch_sheepshaver = QAction("▶️ Launch Sheepshaver", self)
-        launch_sheepshaver.triggered.connect(lambda: self.launch_emulator('sheepshaver'))
+        launch_sheepshaver.triggered.connect(self._launch_sheepshaver)
         toolbar.addAction(launch_sheepshaver)
         
         # Spacer to push About to the right
@@ -1054,6 +1426,7 @@ class PrefsEditor(QMainWindow):
         about_action = QAction("ℹ️ About", self)
         about_action.triggered.connect(self.show_about)
         toolbar.addAction(about_action)
+        toolbar.setUpdatesEnabled(True)
         
         # Main tabs
         self.main_tabs = QTabWidget()
@@ -1061,41 +1434,83 @@ class PrefsEditor(QMainWindow):
         
         self.basilisk_tab = EmulatorTab('basilisk')
         self.sheepshaver_tab = EmulatorTab('sheepshaver')
-        self.settings_tab = SettingsTab()
         
         self.main_tabs.addTab(self.basilisk_tab, "Basilisk II")
         self.main_tabs.addTab(self.sheepshaver_tab, "Sheepshaver")
-        self.main_tabs.addTab(self.settings_tab, "⚙️ Settings")
+        
+        # The Settings tab is built the first time it is opened
+        self.settings_tab = None
+        self.settings_page = QWidget()
+        QVBoxLayout(self.settings_page).setContentsMargins(0, 0, 0, 0)
+        self.main_tabs.addTab(self.settings_page, "⚙️ Settings")
+        self.main_tabs.currentChanged.connect(self.on_main_tab_changed)
+    
+    def on_main_tab_changed(self, index: int):
+        """Create the Settings tab on its first activation."""
+        if self.main_tabs.widget(index) is not self.settings_page:
+            return
+        self.main_tabs.currentChanged.disconnect(self.on_main_tab_changed)
+        self.settings_tab = SettingsTab(self.settings)
+        self.settings_page.layout().addWidget(self.settings_tab)
     
     def load_configs(self):
-        """Load configuration files."""
-        basilisk_cfg = self.settings.value('basilisk/cfg', '')
-        if basilisk_cfg and os.path.exists(basilisk_cfg):
-            config = ConfigParser.parse(basilisk_cfg)
-            self.basilisk_tab.load_config(config)
-        
-        sheepshaver_cfg = self.settings.value('sheepshaver/cfg', '')
-        if sheepshaver_cfg and os.path.exists(sheepshaver_cfg):
-            config = ConfigParser.parse(sheepshaver_cfg)
-            self.sheepshaver_tab.load_config(config)
+        """Load configuration files in the background."""
+        # Results of an earlier, still running Reload are dropped
+        self._load_generation += 1
+        for emulator_type in ('basilisk', 'sheepshaver'):
+            cfg = self.settings.value(f'{emulator_type}/cfg', '')
+            if cfg and os.path.exists(cfg):
+                self.loader.load((self._load_generation, emulator_type, cfg), cfg)
+    
+    def on_config_loaded(self, token, config: dict):
+        generation, emulator_type, cfg = token
+        if generation != self._load_generation:
+            return
+        if emulator_type == 'basilisk':
+            self.basilisk_tab.load_config(config, cfg)
+        else:
+            self.sheepshaver_tab.load_config(config, cfg)
+    
+    def on_load_failed(self, token, filepath: str, error: str):
+        if token[0] != self._load_generation:
+            return
+        QMessageBox.warning(self, "Reload", f"Failed to load {filepath}:\n{error}")
+    
+    def finish_loading(self):
+        """Apply any pending background loads before reading the tabs."""
+        self.loader.wait()
+    
+    def closeEvent(self, event):
+        # Let background parses finish before the window goes away
+        self.loader.join()
+        super().closeEvent(event)
     
     def save_all_configs(self):
         """Save all configuration files."""
+        self.finish_loading()
         try:
             basilisk_cfg = self.settings.value('basilisk/cfg', '')
             if basilisk_cfg:
-                config = self.basilisk_tab.save_config()
+                config = self.basilisk_tab.save_config(basilisk_cfg)
                 ConfigParser.save(basilisk_cfg, config)
             
             sheepshaver_cfg = self.settings.value('sheepshaver/cfg', '')
             if sheepshaver_cfg:
-                config = self.sheepshaver_tab.save_config()
+                config = self.sheepshaver_tab.save_config(sheepshaver_cfg)
                 ConfigParser.save(sheepshaver_cfg, config)
             
             QMessageBox.information(self, "Save", "Configurations saved successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save configurations:\n{e}")
     
+    @Slot()
+    def _launch_basilisk(self):
+        self.launch_emulator('basilisk')
+    
+    @Slot()
+    def _launch_sheepshaver(self):
+        self.launch_emulator('sheepshaver')
+    
     def launch_emulator(self, emulator_type: str):
         """Launch the specified emulator."""
         if emulator_type == 'basilisk':
@@ -1113,12 +1528,13 @@ class PrefsEditor(QMainWindow):
             QMessageBox.warning(self, "Launch", f"Executable not found: {exe}")
             return
         
+        self.finish_loading()
         try:
             # Save config before launching
             if emulator_type == 'basilisk':
-                config = self.basilisk_tab.save_config()
+                config = self.basilisk_tab.save_config(cfg)
             else:
-                config = self.sheepshaver_tab.save_config()
+                config = self.sheepshaver_tab.save_config(cfg)
             
             if cfg:
                 ConfigParser.save(cfg, config)
@@ -1135,7 +1551,7 @@ class PrefsEditor(QMainWindow):
                 if cfg:
                     args.extend(['--config', cfg])
             
-            subprocess.Popen(args, start_new_session=True)
+            _spawn_detached(args)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to launch emulator:\n{e}")
@@ -1151,16 +1567,17 @@ class PrefsEditor(QMainWindow):
         layout = QVBoxLayout(dialog)
         layout.setAlignment(Qt.AlignCenter)
         
-        # App icon
-        icon_path = os.path.join(os.path.dirname(__file__), 'Appicon.png')
-        if os.path.exists(icon_path):
-            icon_label = QLabel()
-            pixmap = QPixmap(icon_path)
+        # App icon, loaded and scaled once per session
+        if PrefsEditor._about_pixmap is None:
+            pixmap = QPixmap(APP_ICON_PATH) if os.path.exists(APP_ICON_PATH) else QPixmap()
             if not pixmap.isNull():
                 pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                icon_label.setPixmap(pixmap)
-                icon_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(icon_label)
+            PrefsEditor._about_pixmap = pixmap
+        if not PrefsEditor._about_pixmap.isNull():
+            icon_label = QLabel()
+            icon_label.setPixmap(PrefsEditor._about_pixmap)
+            icon_label.setAlignment(Qt.AlignCenter)
+            layout.addWidget(icon_label)
         
         # App name
         name_label = QLabel("Sheepshaver & Basilisk II\nPreferences Editor")
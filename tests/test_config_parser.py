@@ -0,0 +1,96 @@
+"""Round-trip tests for ConfigParser.parse / ConfigParser.save."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from main import ConfigParser
+
+
+class ConfigParserSaveTest(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, 'prefs')
+
+    def write(self, text: str):
+        Path(self.path).write_bytes(text.encode('utf-8'))
+
+    def read(self) -> str:
+        return Path(self.path).read_bytes().decode('utf-8')
+
+    def test_roundtrip_keeps_file(self):
+        text = "disk /a.img\ndisk /b.img\nrom /q.rom\nramsize 134217728\nnocdrom true\n"
+        self.write(text)
+        ConfigParser.save(self.path, ConfigParser.parse(self.path))
+        self.assertEqual(self.read(), text)
+
+    def test_disks_replace_first_disk_line(self):
+        self.write("rom /q.rom\ndisk /a.img\nscreen win/800/600\ndisk /b.img\n")
+        ConfigParser.save(self.path, {'disks': ['/c.img', '/d.img']})
+        self.assertEqual(
+            self.read(),
+            "rom /q.rom\ndisk /c.img\ndisk /d.img\nscreen win/800/600\n",
+        )
+
+    def test_disks_go_first_without_disk_line(self):
+        self.write("rom /q.rom\n")
+        ConfigParser.save(self.path, {'disks': ['/a.img']})
+        self.assertEqual(self.read(), "disk /a.img\nrom /q.rom\n")
+
+    def test_disks_kept_when_not_saved(self):
+        self.write("disk /a.img\nrom /q.rom\n")
+        ConfigParser.save(self.path, {'rom': '/r.rom'})
+        self.assertEqual(self.read(), "disk /a.img\nrom /r.rom\n")
+
+    def test_later_duplicates_of_managed_key_dropped(self):
+        self.write("cdrom /dev/sr0\nrom /q.rom\ncdrom /dev/sr1\n")
+        ConfigParser.save(self.path, {'cdrom': '/dev/sr2'})
+        self.assertEqual(self.read(), "cdrom /dev/sr2\nrom /q.rom\n")
+
+    def test_duplicates_of_unmanaged_key_kept(self):
+        text = "cdrom /dev/sr0\ncdrom /dev/sr1\nrom /q.rom\n"
+        self.write(text)
+        ConfigParser.save(self.path, {'rom': '/r.rom'})
+        self.assertEqual(self.read(), text.replace('/q.rom', '/r.rom'))
+
+    def test_none_removes_key(self):
+        self.write("title My Mac\nrom /q.rom\n")
+        ConfigParser.save(self.path, {'title': None})
+        self.assertEqual(self.read(), "rom /q.rom\n")
+
+    def test_unmanaged_lines_kept(self):
+        self.write("# comment\nwindowmodes 3\n\nrom /q.rom\n")
+        ConfigParser.save(self.path, {'rom': '/r.rom', 'nogui': True})
+        self.assertEqual(
+            self.read(),
+            "# comment\nwindowmodes 3\n\nrom /r.rom\nnogui true\n",
+        )
+
+    def test_new_file_created(self):
+        ConfigParser.save(self.path, {'disks': ['/a.img'], 'rom': '/q.rom', 'fpu': False})
+        self.assertEqual(self.read(), "disk /a.img\nrom /q.rom\nfpu false\n")
+
+    def test_identical_content_not_written(self):
+        self.write("rom /q.rom\nnocdrom true\n")
+        with mock.patch.object(ConfigParser, '_replace_file') as replace:
+            ConfigParser.save(self.path, {'rom': '/q.rom', 'nocdrom': True})
+        replace.assert_not_called()
+
+    def test_crlf_input(self):
+        self.write("disk /a.img\r\nrom /q.rom\r\ntitle My Mac\r\nnocdrom true\r\n")
+        config = ConfigParser.parse(self.path)
+        self.assertEqual(config['disks'], ['/a.img'])
+        self.assertEqual(config['rom'], '/q.rom')
+        self.assertEqual(config['title'], 'My Mac')
+        self.assertIs(config['nocdrom'], True)
+        # Saving normalises the file to LF line endings
+        ConfigParser.save(self.path, {'rom': '/r.rom'})
+        self.assertEqual(self.read(), "disk /a.img\nrom /r.rom\ntitle My Mac\nnocdrom true\n")
+
+
+if __name__ == '__main__':
+    unittest.main()